@@ -21,12 +21,14 @@
 
 from gi.repository import Gio, GLib
 
-DOT_IS_NOT_EXTENSION = {
-    "application/x-sharedlib",
-    "application/x-executable",
-    "application/x-pie-executable",
-    "inode/symlink",
-}
+DOT_IS_NOT_EXTENSION = frozenset(
+    (
+        "application/x-sharedlib",
+        "application/x-executable",
+        "application/x-pie-executable",
+        "inode/symlink",
+    )
+)
 
 
 # This is so nonexistent URIs never match
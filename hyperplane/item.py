@@ -19,8 +19,10 @@
 
 """An item representing a file to be set up through a `GtkSignalListItemFactory`."""
 import logging
+from collections import namedtuple
+from functools import cache, partial
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk
 from gi.repository.GLib import idle_add
@@ -30,7 +32,159 @@ from hyperplane.file_properties import DOT_IS_NOT_EXTENSION
 from hyperplane.hover_page_opener import HypHoverPageOpener
 from hyperplane.utils.files import rm
 from hyperplane.utils.symbolics import get_color_for_symbolic, get_symbolic
-from hyperplane.utils.thumbnail import generate_thumbnail
+from hyperplane.utils.thumbnail import (
+    can_thumbnail,
+    generate_thumbnail,
+    get_cached_thumbnail,
+    load_thumbnail,
+    queue_thumbnail,
+)
+
+# Attributes of a directory's children needed for its preview
+_DIR_ENUM_ATTRS = ",".join(
+    (
+        Gio.FILE_ATTRIBUTE_STANDARD_SYMBOLIC_ICON,
+        Gio.FILE_ATTRIBUTE_STANDARD_CONTENT_TYPE,
+        Gio.FILE_ATTRIBUTE_THUMBNAIL_PATH,
+        Gio.FILE_ATTRIBUTE_STANDARD_NAME,
+        Gio.FILE_ATTRIBUTE_STANDARD_IS_HIDDEN,
+    )
+)
+
+
+@cache
+def _css_classes(init_classes: tuple[str, ...], *extra: str) -> tuple[str, ...]:
+    # There are only a few possible combinations of style classes,
+    # so build each of them only once
+    return init_classes + extra
+
+
+_ColorClasses = namedtuple(
+    "ColorClasses",
+    (
+        "icon",
+        "background",
+        "solid_background",
+        "extension",
+        "extension_thumb",
+        "icon_light_only",
+    ),
+)
+
+
+@cache
+def _color_classes(color: str) -> _ColorClasses:
+    return _ColorClasses(
+        f"{color}-icon",
+        f"{color}-background",
+        f"{color}-solid-background",
+        f"{color}-extension",
+        f"{color}-extension-thumb",
+        f"{color}-icon-light-only",
+    )
+
+
+_ZoomParams = namedtuple(
+    "ZoomParams",
+    (
+        "box_margin",
+        "play_margin",
+        "play_pixel_size",
+        "thumbnail_size",
+        "dir_spacing",
+        "dir_margin_start",
+        "dir_margin_top",
+        "dir_thumbnail_size",
+        "icon_pixel_size",
+    ),
+)
+
+
+def _get_zoom_params(zoom_level: int) -> _ZoomParams:
+    match zoom_level:
+        case 0:
+            thumbnail_size = (48, 48)
+        case 1:
+            # This is not the exact aspect ratio, but it is close enough.
+            # It's good for keeping the folder textures sharp.
+            # Or not apparently. Whether they are sharp seems really random.
+            thumbnail_size = (96, 74)
+        case 2:
+            thumbnail_size = (96, 96)
+        case _:
+            thumbnail_size = (40 * zoom_level, 32 * zoom_level)
+
+    if zoom_level < 1:
+        dir_spacing, dir_margin_start, dir_margin_top = 8, 8, 4
+    elif zoom_level < 3:
+        dir_spacing, dir_margin_start, dir_margin_top = 12, 10, 6
+    elif zoom_level < 4:
+        dir_spacing, dir_margin_start, dir_margin_top = 6, 6, 6
+    elif zoom_level < 5:
+        dir_spacing, dir_margin_start, dir_margin_top = 9, 8, 8
+    else:
+        dir_spacing, dir_margin_start, dir_margin_top = 9, 7, 7
+
+    if zoom_level < 4:
+        dir_thumbnail_size = (32, 32)
+    elif zoom_level < 5:
+        dir_thumbnail_size = (42, 42)
+    else:
+        dir_thumbnail_size = (56, 56)
+
+    return _ZoomParams(
+        box_margin=zoom_level * 3,
+        play_margin=zoom_level * 2 + 8,
+        play_pixel_size=zoom_level * 4 + 8,
+        thumbnail_size=thumbnail_size,
+        dir_spacing=dir_spacing,
+        dir_margin_start=dir_margin_start,
+        dir_margin_top=dir_margin_top,
+        dir_thumbnail_size=dir_thumbnail_size,
+        icon_pixel_size=16 if zoom_level < 2 else 32,
+    )
+
+
+# Zoom levels range from 0 in list view to 5 in grid view
+_ZOOM_TABLE = {zoom_level: _get_zoom_params(zoom_level) for zoom_level in range(6)}
+
+
+@cache
+def _get_menu_items(
+    is_dir: bool, is_executable: bool, in_trash: bool, in_trash_root: bool
+) -> frozenset[str]:
+    menu_items = {
+        "rename",
+        "copy",
+        "cut",
+        "trash",
+        "open",
+        "open-with",
+        "properties",
+    }
+    if is_executable:
+        menu_items.add("execute-file")
+
+    if is_dir:
+        menu_items.add("open-new-tab")
+        menu_items.add("open-new-window")
+
+    if in_trash:
+        menu_items.remove("trash")
+        menu_items.remove("rename")
+
+    if in_trash_root:
+        menu_items.add("trash-restore")
+        menu_items.add("trash-delete")
+
+    return frozenset(menu_items)
+
+
+def _set_margins(widget: Gtk.Widget, margin: int) -> None:
+    widget.set_margin_start(margin)
+    widget.set_margin_end(margin)
+    widget.set_margin_top(margin)
+    widget.set_margin_bottom(margin)
 
 
 @Gtk.Template(resource_path=shared.PREFIX + "/gtk/item.ui")
@@ -69,7 +223,9 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
     dragged_gfiles: dict[Gio.File, Gio.FileInfo] = {}
 
     gfile: Gio.File
+    uri: Optional[str]
     is_dir: bool
+    is_media: bool
     content_type: str
     extension: str
     color: str
@@ -85,9 +241,14 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
         super().__init__(**kwargs)
         HypHoverPageOpener.__init__(self)
 
+        self.uri = None
         self.full_name = None
         self.stem = None
         self._thumbnail_paintable = None
+        # The folder preview thumbnails are visible by default
+        self._dir_thumbnails_shown = True
+        self._cancellable = Gio.Cancellable.new()
+        self._thumbnail_jobs = []
         self.overlay.set_measure_overlay(self.circular_icon, True)
 
         self.item = item
@@ -98,15 +259,19 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
         self.__view_setup()
 
         self.zoom_level = 1
+        self._applied_zoom_level = None
+        self._zoom_params = None
         self.__zoom(
             shared.state_schema.get_uint(
                 "grid-zoom-level" if shared.grid_view else "list-zoom-level"
             )
         )
-        shared.postmaster.connect(
-            "zoom", lambda _obj, zoom_level: self.__zoom(zoom_level)
-        )
-        shared.postmaster.connect("cut-uris-changed", self.__cut_uris_changed)
+
+        # Only listen to application-wide signals while the item is realized
+        # so handlers don't pile up on the postmaster as items are discarded
+        self._postmaster_handlers = ()
+        self.connect("realize", self.__realize)
+        self.connect("unrealize", self.__unrealize)
 
         # Left-click
         def set_rubberband(*_args: Any) -> None:
@@ -137,12 +302,14 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
         self.add_controller(drag_source)
 
         # Save initial style classes
-        self.thumb_init_classes = self.thumbnail_overlay.get_css_classes()
-        self.icon_init_classes = self.icon.get_css_classes()
-        self.circular_icon_init_classes = self.circular_icon.get_css_classes()
-        self.ext_init_classes = self.extension_label.get_css_classes()
-        self.dir_thumb_init_classes = self.dir_thumbnail_1.get_css_classes()
-        self.dir_icon_init_classes = self.dir_thumbnail_1.get_child().get_css_classes()
+        self.thumb_init_classes = tuple(self.thumbnail_overlay.get_css_classes())
+        self.icon_init_classes = tuple(self.icon.get_css_classes())
+        self.circular_icon_init_classes = tuple(self.circular_icon.get_css_classes())
+        self.ext_init_classes = tuple(self.extension_label.get_css_classes())
+        self.dir_thumb_init_classes = tuple(self.dir_thumbnail_1.get_css_classes())
+        self.dir_icon_init_classes = tuple(
+            self.dir_thumbnail_1.get_child().get_css_classes()
+        )
 
     @GObject.Property(type=str)
     def display_name(self) -> str:
@@ -191,15 +358,24 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
 
     def bind(self) -> None:
         """Build the icon after the object has been bound."""
-        self.file_info = self.item.get_item()
-        self.gfile = self.file_info.get_attribute_object("standard::file")
+        self.file_info = file_info = self.item.get_item()
+        self.gfile = file_info.get_attribute_object("standard::file")
+        self._cancellable = Gio.Cancellable.new()
+        self.uri = self.gfile.get_uri()
 
         self.__cut_uris_changed()
 
-        self.gicon = get_symbolic(self.file_info.get_symbolic_icon())
-        self.content_type = self.file_info.get_content_type()
-        self.color = get_color_for_symbolic(self.content_type, self.gicon)
-        self.edit_name = self.file_info.get_edit_name()
+        # Read everything needed from the FileInfo in one go
+        content_type = file_info.get_content_type()
+        full_name = file_info.get_display_name()
+        can_execute = file_info.get_attribute_boolean(
+            Gio.FILE_ATTRIBUTE_ACCESS_CAN_EXECUTE
+        )
+
+        self.gicon = get_symbolic(file_info.get_symbolic_icon())
+        self.content_type = content_type
+        self.color = get_color_for_symbolic(content_type, self.gicon)
+        self.edit_name = file_info.get_edit_name()
 
         # Build additional tags
         if self.page.tags:
@@ -218,63 +394,64 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
                     self.tags_label.set_visible(True)
                     self.additional_tags = ", ".join(additional_tags)
 
-        self.is_dir = self.can_open_page = self.content_type == "inode/directory"
-        self.is_executable = (not self.is_dir) and bool(
-            self.file_info.get_attribute_boolean(Gio.FILE_ATTRIBUTE_ACCESS_CAN_EXECUTE)
+        self.is_dir = is_dir = content_type == "inode/directory"
+        self.can_open_page = is_dir
+        self.is_media = bool(content_type) and content_type.startswith(
+            ("video/", "audio/")
         )
-        self.full_name = self.file_info.get_display_name()
-        if self.is_dir:
-            self.stem = self.full_name
+        self.is_executable = (not is_dir) and can_execute
+        self.full_name = full_name
+        if is_dir:
+            self.stem = full_name
             self.extension = None
             self.picture.set_content_fit(Gtk.ContentFit.FILL)
 
             self.gfile.enumerate_children_async(
-                ",".join(
-                    (
-                        Gio.FILE_ATTRIBUTE_STANDARD_SYMBOLIC_ICON,
-                        Gio.FILE_ATTRIBUTE_STANDARD_CONTENT_TYPE,
-                        Gio.FILE_ATTRIBUTE_THUMBNAIL_PATH,
-                        Gio.FILE_ATTRIBUTE_STANDARD_NAME,
-                        Gio.FILE_ATTRIBUTE_STANDARD_IS_HIDDEN,
-                    )
-                ),
+                _DIR_ENUM_ATTRS,
                 Gio.FileQueryInfoFlags.NONE,
                 GLib.PRIORITY_DEFAULT,
-                None,
+                self._cancellable,
                 self.__dir_children_cb,
             )
 
         else:
             # Blacklist some MIME types from getting extension badges
-            if self.content_type in DOT_IS_NOT_EXTENSION:
-                self.stem = self.full_name
+            if content_type in DOT_IS_NOT_EXTENSION:
+                self.stem = full_name
                 self.extension = None
             else:
-                self.stem = Path(self.full_name).stem
-                self.extension = Path(self.full_name).suffix[1:].upper()
+                stem, dot, extension = full_name.rpartition(".")
+                if dot and stem and extension:
+                    self.stem = stem
+                    self.extension = extension.upper()
+                else:
+                    self.stem = full_name
+                    self.extension = None
             self.picture.set_content_fit(Gtk.ContentFit.COVER)
 
-            if thumbnail_path := self.file_info.get_attribute_byte_string(
+            if thumbnail_path := file_info.get_attribute_byte_string(
                 Gio.FILE_ATTRIBUTE_THUMBNAIL_PATH
             ):
-                try:
-                    texture = Gdk.Texture.new_from_filename(thumbnail_path)
-                except GLib.Error:
-                    texture = None
-
-                self.__thumbnail_cb(texture)
+                # Show recently loaded thumbnails right away
+                # instead of waiting behind thumbnailers in the pool
+                if texture := get_cached_thumbnail(thumbnail_path):
+                    self.__set_thumbnail(texture, False, self._cancellable)
+                else:
+                    self.__queue_thumbnail(
+                        load_thumbnail,
+                        (thumbnail_path,),
+                        partial(self.__thumbnail_cb, cancellable=self._cancellable),
+                    )
             elif (
-                self.file_info.get_attribute_uint32(
+                file_info.get_attribute_uint32(
                     Gio.FILE_ATTRIBUTE_FILESYSTEM_USE_PREVIEW
                 )
                 != Gio.FilesystemPreviewType.NEVER
-            ):
-                GLib.Thread.new(
-                    None,
+            ) and can_thumbnail(content_type):
+                self.__queue_thumbnail(
                     generate_thumbnail,
-                    self.gfile,
-                    self.content_type,
-                    self.__thumbnail_cb,
+                    (self.gfile, content_type),
+                    partial(self.__thumbnail_cb, cancellable=self._cancellable),
                 )
             else:
                 self.__thumbnail_cb()
@@ -284,6 +461,41 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
 
     def unbind(self) -> None:
         """Cleanup after the object has been unbound from its item."""
+        # Don't load thumbnails for items that have been scrolled out of view
+        self._cancellable.cancel()
+        for job in self._thumbnail_jobs:
+            job.cancel()
+        self._thumbnail_jobs.clear()
+
+        # The widget is recycled, so don't show this file's thumbnails for the next one
+        self.thumbnail_paintable = None
+        self.play_button.set_visible(False)
+        for index in range(1, 4):
+            picture = getattr(self, f"dir_picture_{index}")
+            picture.set_paintable(None)
+            picture.set_visible(False)
+
+    def __realize(self, *_args: Any) -> None:
+        self._postmaster_handlers = (
+            shared.postmaster.connect(
+                "zoom", lambda _obj, zoom_level: self.__zoom(zoom_level)
+            ),
+            shared.postmaster.connect("cut-uris-changed", self.__cut_uris_changed),
+        )
+
+        # Catch up on changes made while the item was unrealized
+        self.__zoom(
+            shared.state_schema.get_uint(
+                "grid-zoom-level" if shared.grid_view else "list-zoom-level"
+            )
+        )
+        self.__cut_uris_changed()
+
+    def __unrealize(self, *_args: Any) -> None:
+        for handler in self._postmaster_handlers:
+            shared.postmaster.disconnect(handler)
+
+        self._postmaster_handlers = ()
 
     def __drag_prepare(self, _src: Gtk.DragSource, _x: float, _y: float) -> None:
         self.__select_self(unselect_rest=False)
@@ -306,11 +518,22 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
             if thumbnail_path := file_info.get_attribute_byte_string(
                 Gio.FILE_ATTRIBUTE_THUMBNAIL_PATH
             ):
-                picture = Gtk.Picture.new_for_filename(thumbnail_path)
+                if texture := get_cached_thumbnail(thumbnail_path):
+                    picture = Gtk.Picture.new_for_paintable(texture)
+                else:
+                    picture = Gtk.Picture.new()
+                    queue_thumbnail(
+                        load_thumbnail,
+                        (thumbnail_path,),
+                        lambda texture, picture: idle_add(
+                            picture.set_paintable, texture
+                        ),
+                        picture,
+                    )
                 picture.set_content_fit(Gtk.ContentFit.COVER)
-                picture.add_css_class("item-thumbnail")
-                picture.add_css_class("thumbnail-picture")
-                picture.add_css_class("gray-solid-background")
+                picture.set_css_classes(
+                    ("item-thumbnail", "thumbnail-picture", "gray-solid-background")
+                )
 
                 # TODO: Stop using Adw.Clamp here
                 item = Adw.Clamp(
@@ -336,9 +559,14 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
                 item.set_icon_size(Gtk.IconSize.LARGE)
                 item.set_valign(Gtk.Align.CENTER)
                 item.set_halign(Gtk.Align.CENTER)
-                item.add_css_class(f"{color}-solid-background")
-                item.add_css_class(f"{color}-icon")
-                item.add_css_class("circular-icon")
+                color_classes = _color_classes(color)
+                item.set_css_classes(
+                    (
+                        color_classes.solid_background,
+                        color_classes.icon,
+                        "circular-icon",
+                    )
+                )
                 item.set_opacity(0.9)
 
             # Tower
@@ -368,55 +596,44 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
     def __dir_children_cb(self, gfile: Gio.File, result: Gio.AsyncResult) -> None:
         try:
             files = gfile.enumerate_children_finish(result)
-        except GLib.Error:
-            self.__thumbnail_cb()
+        except GLib.Error as error:
+            if not error.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                self.__thumbnail_cb()
             return
 
-        def done(index) -> None:
-            for thumbnail_index in range(1, 4):
-                getattr(self, f"dir_thumbnail_{thumbnail_index}").set_visible(
-                    index + 1 >= thumbnail_index
-                )
-
-            self.__thumbnail_cb(open_folder=bool(index))
+        files.next_files_async(
+            3,
+            GLib.PRIORITY_DEFAULT,
+            self._cancellable,
+            self.__dir_next_files_cb,
+            gfile,
+        )
 
-        def next_files_cb(
-            enumerator: Gio.FileEnumerator, result: Gio.AsyncResult, index: int
-        ) -> None:
-            if index == 3:
-                done(index - 1)
+    def __dir_next_files_cb(
+        self, files: Gio.FileEnumerator, result: Gio.AsyncResult, gfile: Gio.File
+    ) -> None:
+        try:
+            files_list = files.next_files_finish(result)
+        except GLib.Error as error:
+            if error.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                files.close_async(GLib.PRIORITY_DEFAULT)
                 return
 
-            picture = getattr(self, f"dir_picture_{index + 1}")
+            files_list = []
 
-            try:
-                files_list = enumerator.next_files_finish(result)
-            except GLib.Error:
-                self.__dir_thumbnail_cb(None, picture)
-                done(index)
-                return
-
-            try:
-                file_info = files_list[0]
-            except IndexError:
-                self.__dir_thumbnail_cb(None, picture)
-                done(index)
-                return
+        files.close_async(GLib.PRIORITY_DEFAULT)
 
+        shown = 0
+        for index, file_info in enumerate(files_list[:3]):
             if not (content_type := file_info.get_content_type()):
-                self.__dir_thumbnail_cb(None, picture)
-                done(index)
-                return
+                break
 
             if (not shared.show_hidden) and file_info.get_is_hidden():
-                self.__dir_thumbnail_cb(None, picture)
-                done(index)
-                return
+                break
 
             thumbnail = getattr(self, f"dir_thumbnail_{index + 1}")
-
-            index += 1
-            files.next_files_async(1, GLib.PRIORITY_DEFAULT, None, next_files_cb, index)
+            picture = getattr(self, f"dir_picture_{index + 1}")
+            shown += 1
 
             gicon = get_symbolic(file_info.get_symbolic_icon())
 
@@ -424,74 +641,123 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
 
             if content_type == "inode/directory":
                 thumbnail.set_css_classes(
-                    self.dir_thumb_init_classes
-                    + ["light-blue-background", "white-icon"]
+                    _css_classes(
+                        self.dir_thumb_init_classes,
+                        "light-blue-background",
+                        "white-icon",
+                    )
                 )
 
                 thumbnail.get_child().set_css_classes(
                     self.dir_icon_init_classes,
                 )
                 self.__dir_thumbnail_cb(None, picture)
-                return
+                continue
 
             thumbnail.set_css_classes(
-                self.dir_thumb_init_classes + ["white-background"]
+                _css_classes(self.dir_thumb_init_classes, "white-background")
             )
 
             color = get_color_for_symbolic(content_type, gicon)
 
             thumbnail.get_child().set_css_classes(
-                self.dir_icon_init_classes + [f"{color}-icon-light-only"]
+                _css_classes(
+                    self.dir_icon_init_classes, _color_classes(color).icon_light_only
+                )
             )
 
             if thumbnail_path := file_info.get_attribute_byte_string(
                 Gio.FILE_ATTRIBUTE_THUMBNAIL_PATH
             ):
-                self.__dir_thumbnail_cb(
-                    Gdk.Texture.new_from_filename(thumbnail_path), picture
+                self.__queue_thumbnail(
+                    load_thumbnail,
+                    (thumbnail_path,),
+                    partial(self.__dir_thumbnail_cb, cancellable=self._cancellable),
+                    picture,
                 )
-                return
+                continue
+
+            if not can_thumbnail(content_type):
+                self.__dir_thumbnail_cb(None, picture)
+                continue
 
             child_gfile = gfile.get_child(file_info.get_name())
 
-            GLib.Thread.new(
-                None,
+            self.__queue_thumbnail(
                 generate_thumbnail,
-                child_gfile,
-                content_type,
-                self.__dir_thumbnail_cb,
+                (child_gfile, content_type),
+                partial(self.__dir_thumbnail_cb, cancellable=self._cancellable),
                 picture,
             )
 
-        # TODO: Could be optimized if I called next_files with 3 the first time
-        files.next_files_async(1, GLib.PRIORITY_DEFAULT, None, next_files_cb, 0)
+        for thumbnail_index in range(1, 4):
+            getattr(self, f"dir_thumbnail_{thumbnail_index}").set_visible(
+                shown >= thumbnail_index
+            )
+        self._dir_thumbnails_shown = bool(shown)
+
+        self.__thumbnail_cb(open_folder=bool(shown))
 
     def __dir_thumbnail_cb(
         self,
         texture: Optional[Gdk.Texture] = None,
         picture: Optional[Gtk.Picture] = None,  # This is not actually optional
+        cancellable: Optional[Gio.Cancellable] = None,
     ) -> None:
-        idle_add(picture.set_visible, bool(texture))
+        # This may be called from a thumbnailer thread
+        idle_add(
+            self.__set_dir_picture, texture, picture, cancellable or self._cancellable
+        )
+
+    def __set_dir_picture(
+        self,
+        texture: Optional[Gdk.Texture],
+        picture: Gtk.Picture,
+        cancellable: Gio.Cancellable,
+    ) -> None:
+        # The item has been unbound since
+        if cancellable.is_cancelled():
+            return
+
+        picture.set_visible(bool(texture))
 
         if not texture:
             return
 
-        idle_add(picture.set_paintable, texture)
+        picture.set_paintable(texture)
 
     def __thumbnail_cb(
-        self, texture: Optional[Gdk.Texture] = None, open_folder: bool = False
+        self,
+        texture: Optional[Gdk.Texture] = None,
+        open_folder: bool = False,
+        cancellable: Optional[Gio.Cancellable] = None,
     ) -> None:
+        # This may be called from a thumbnailer thread, so apply
+        # all widget updates together in one main loop iteration
         idle_add(
-            self.play_button.set_visible,
-            texture
-            and self.content_type.split("/")[0]
-            in (
-                "video",
-                "audio",
-            ),
+            self.__set_thumbnail,
+            texture,
+            open_folder,
+            cancellable or self._cancellable,
         )
 
-        if self.is_dir:
+    def __set_thumbnail(
+        self,
+        texture: Optional[Gdk.Texture],
+        open_folder: bool,
+        cancellable: Gio.Cancellable,
+    ) -> None:
+        # The item has been unbound since
+        if cancellable.is_cancelled():
+            return
+
+        is_dir = self.is_dir
+        color_classes = _color_classes(self.color)
+        thumbnail_overlay = self.thumbnail_overlay
+
+        self.play_button.set_visible(bool(texture) and self.is_media)
+
+        if is_dir:
             texture = (
                 shared.open_folder_texture
                 if open_folder
@@ -499,150 +765,131 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
             )
 
         self.__set_circular(not texture)
-        idle_add(self.picture.set_visible, bool(texture))
-        if not self.is_dir:
+        self.picture.set_visible(bool(texture))
+        if (not is_dir) and self._dir_thumbnails_shown:
+            self._dir_thumbnails_shown = False
             for thumbnail in (
                 self.dir_thumbnail_1,
                 self.dir_thumbnail_2,
                 self.dir_thumbnail_3,
             ):
-                idle_add(thumbnail.set_visible, False)
+                thumbnail.set_visible(False)
 
         if texture:
-            if self.is_dir:
-                idle_add(
-                    self.thumbnail_overlay.set_css_classes,
-                    self.thumb_init_classes + ["dark-blue-background"],
+            thumbnail_overlay.set_css_classes(
+                _css_classes(
+                    self.thumb_init_classes,
+                    "dark-blue-background" if is_dir else "gray-background",
                 )
-            else:
-                idle_add(
-                    self.thumbnail_overlay.set_css_classes,
-                    self.thumb_init_classes + ["gray-background"],
-                )
-
-            idle_add(
-                self.extension_label.set_css_classes,
-                self.ext_init_classes + [f"{self.color}-extension-thumb"],
+            )
+            self.extension_label.set_css_classes(
+                _css_classes(self.ext_init_classes, color_classes.extension_thumb)
             )
             self.thumbnail_paintable = texture
             return
 
-        idle_add(
-            self.icon.set_css_classes,
-            self.icon_init_classes + [f"{self.color}-icon"],
+        self.icon.set_css_classes(
+            _css_classes(self.icon_init_classes, color_classes.icon)
         )
-        idle_add(
-            self.circular_icon.set_css_classes,
-            self.circular_icon_init_classes
-            + [f"{self.color}-icon", f"{self.color}-background"],
+        self.circular_icon.set_css_classes(
+            _css_classes(
+                self.circular_icon_init_classes,
+                color_classes.icon,
+                color_classes.background,
+            )
         )
-        idle_add(
-            self.thumbnail_overlay.set_css_classes,
-            self.thumb_init_classes + [f"{self.color}-background"],
+        thumbnail_overlay.set_css_classes(
+            _css_classes(self.thumb_init_classes, color_classes.background)
         )
-        idle_add(
-            self.extension_label.set_css_classes,
-            self.ext_init_classes + [f"{self.color}-extension"],
+        self.extension_label.set_css_classes(
+            _css_classes(self.ext_init_classes, color_classes.extension)
         )
 
+    def __queue_thumbnail(
+        self, func: Callable, func_args: tuple, callback: Callable, *args: Any
+    ) -> None:
+        self._thumbnail_jobs.append(queue_thumbnail(func, func_args, callback, *args))
+
     def __set_circular(self, circular: bool) -> None:
         # The icon can never be circular if the zoom level is greater than 0
         if self.zoom_level:
             circular = False
 
-        idle_add(self.circular_icon.set_visible, circular)
-        idle_add(self.thumbnail_overlay.set_visible, not circular)
+        self.circular_icon.set_visible(circular)
+        self.thumbnail_overlay.set_visible(not circular)
 
     def __zoom(self, zoom_level: int) -> None:
         # No need to update if the page is currently orphaned
         if not self.page.get_parent():
             return
 
-        self.zoom_level = zoom_level
-        self.__set_circular(not self.thumbnail_paintable)
+        # Nothing to do if the zoom level has already been applied
+        if zoom_level == self._applied_zoom_level:
+            return
 
-        if zoom_level:
-            self.display_name = self.stem
-            self.extension_label.set_opacity(1)
-        else:
-            # Special case only for list view
-            self.display_name = self.full_name
-            self.extension_label.set_opacity(0)
-
-        box_margin = zoom_level * 3
-        self.box.set_margin_start(box_margin)
-        self.box.set_margin_end(box_margin)
-        self.box.set_margin_top(box_margin)
-        self.box.set_margin_bottom(box_margin)
-
-        play_margin = zoom_level * 2 + 8
-        self.play_button_icon.set_margin_start(play_margin)
-        self.play_button_icon.set_margin_end(play_margin)
-        self.play_button_icon.set_margin_top(play_margin)
-        self.play_button_icon.set_margin_bottom(play_margin)
-
-        self.play_button_icon.set_pixel_size((zoom_level * 4) + 8)
-
-        match zoom_level:
-            case 0:
-                self.thumbnail_overlay.set_size_request(48, 48)
-            case 1:
-                # This is not the exact aspect ratio, but it is close enough.
-                # It's good for keeping the folder textures sharp.
-                # Or not apparently. Whether they are sharp seems really random.
-                self.thumbnail_overlay.set_size_request(96, 74)
-            case 2:
-                self.thumbnail_overlay.set_size_request(96, 96)
-            case _:
-                self.thumbnail_overlay.set_size_request(
-                    40 * zoom_level, 32 * zoom_level
-                )
+        # Emit property notifications for the item once all changes are made
+        with self.freeze_notify():
+            self.zoom_level = self._applied_zoom_level = zoom_level
+            self.__set_circular(not self.thumbnail_paintable)
 
-        if zoom_level < 1:
-            self.dir_thumbnails.set_spacing(8)
-            self.dir_thumbnails.set_margin_start(8)
-            self.dir_thumbnails.set_margin_top(4)
-        elif zoom_level < 3:
-            self.dir_thumbnails.set_spacing(12)
-            self.dir_thumbnails.set_margin_start(10)
-            self.dir_thumbnails.set_margin_top(6)
-        elif zoom_level < 4:
-            self.dir_thumbnails.set_spacing(6)
-            self.dir_thumbnails.set_margin_start(6)
-            self.dir_thumbnails.set_margin_top(6)
-        elif zoom_level < 5:
-            self.dir_thumbnails.set_spacing(9)
-            self.dir_thumbnails.set_margin_start(8)
-            self.dir_thumbnails.set_margin_top(8)
-        else:
-            self.dir_thumbnails.set_spacing(9)
-            self.dir_thumbnails.set_margin_start(7)
-            self.dir_thumbnails.set_margin_top(7)
-
-        if zoom_level < 4:
-            self.dir_thumbnail_1.set_size_request(32, 32)
-            self.dir_thumbnail_2.set_size_request(32, 32)
-            self.dir_thumbnail_3.set_size_request(32, 32)
-        elif zoom_level < 5:
-            self.dir_thumbnail_1.set_size_request(42, 42)
-            self.dir_thumbnail_2.set_size_request(42, 42)
-            self.dir_thumbnail_3.set_size_request(42, 42)
-        else:
-            self.dir_thumbnail_1.set_size_request(56, 56)
-            self.dir_thumbnail_2.set_size_request(56, 56)
-            self.dir_thumbnail_3.set_size_request(56, 56)
-
-        # Pixel size is set instead of icon size because otherwise GTK gets confused
-        # and it can lead to graphical glitches after zooming
-        if zoom_level < 2:
-            self.icon.set_pixel_size(16)
-        else:
-            self.icon.set_pixel_size(32)
+            if zoom_level:
+                self.display_name = self.stem
+                self.extension_label.set_opacity(1)
+            else:
+                # Special case only for list view
+                self.display_name = self.full_name
+                self.extension_label.set_opacity(0)
+
+            params = _ZOOM_TABLE.get(zoom_level) or _get_zoom_params(zoom_level)
+
+            # Only touch the properties that differ from the previous zoom level
+            if previous := self._zoom_params:
+                changed = {
+                    field
+                    for field, new, old in zip(params._fields, params, previous)
+                    if new != old
+                }
+            else:
+                changed = set(params._fields)
+            self._zoom_params = params
+
+            if "box_margin" in changed:
+                _set_margins(self.box, params.box_margin)
+
+            if "play_margin" in changed:
+                _set_margins(self.play_button_icon, params.play_margin)
+
+            if "play_pixel_size" in changed:
+                self.play_button_icon.set_pixel_size(params.play_pixel_size)
+
+            if "thumbnail_size" in changed:
+                self.thumbnail_overlay.set_size_request(*params.thumbnail_size)
+
+            dir_thumbnails = self.dir_thumbnails
+            if "dir_spacing" in changed:
+                dir_thumbnails.set_spacing(params.dir_spacing)
+
+            if "dir_margin_start" in changed:
+                dir_thumbnails.set_margin_start(params.dir_margin_start)
+
+            if "dir_margin_top" in changed:
+                dir_thumbnails.set_margin_top(params.dir_margin_top)
+
+            if "dir_thumbnail_size" in changed:
+                self.dir_thumbnail_1.set_size_request(*params.dir_thumbnail_size)
+                self.dir_thumbnail_2.set_size_request(*params.dir_thumbnail_size)
+                self.dir_thumbnail_3.set_size_request(*params.dir_thumbnail_size)
+
+            # Pixel size is set instead of icon size because otherwise GTK gets confused
+            # and it can lead to graphical glitches after zooming
+            if "icon_pixel_size" in changed:
+                self.icon.set_pixel_size(params.icon_pixel_size)
 
     def __view_setup(self, *_args: Any) -> None:
+        # Items are always built from the template,
+        # so only properties that differ from it are set
         if shared.grid_view:
             self.box.set_orientation(Gtk.Orientation.VERTICAL)
-            self.labels_box.set_margin_start(0)
             self.labels_box.set_margin_top(12)
             self.label.set_wrap(True)
             self.label.set_lines(3)
@@ -652,13 +899,7 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
             self.tags_label.set_halign(Gtk.Align.CENTER)
             return
 
-        self.box.set_orientation(Gtk.Orientation.HORIZONTAL)
-        self.labels_box.set_margin_top(0)
         self.labels_box.set_margin_start(12)
-        self.label.set_wrap(False)
-        self.label.set_lines(0)
-        self.label.set_justify(Gtk.Justification.LEFT)
-        self.tags_label.set_justify(Gtk.Justification.LEFT)
         self.label.set_halign(Gtk.Align.START)
         self.tags_label.set_halign(Gtk.Align.START)
 
@@ -669,32 +910,14 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
     def __right_click(self, *_args: Any) -> None:
         self.__select_self()
 
-        menu_items = {
-            "rename",
-            "copy",
-            "cut",
-            "trash",
-            "open",
-            "open-with",
-            "properties",
-        }
-        if self.is_executable:
-            menu_items.add("execute-file")
-
-        if self.is_dir:
-            menu_items.add("open-new-tab")
-            menu_items.add("open-new-window")
-
-        if self.gfile.get_uri_scheme() == "trash":
-            menu_items.remove("trash")
-            menu_items.remove("rename")
-
-            if self.gfile.get_uri().count("/") < 4:
-                # If we are in the root of the trash "directory"
-                menu_items.add("trash-restore")
-                menu_items.add("trash-delete")
-
-        self.page.menu_items = menu_items
+        in_trash = self.gfile.get_uri_scheme() == "trash"
+
+        # If we are in the root of the trash "directory"
+        in_trash_root = in_trash and self.uri.count("/") < 4
+
+        self.page.menu_items = _get_menu_items(
+            self.is_dir, self.is_executable, in_trash, in_trash_root
+        )
 
     def __middle_click(self, *_args: Any) -> None:
         self.__select_self()
@@ -703,8 +926,6 @@ class HypItem(Adw.Bin, HypHoverPageOpener):
             self.get_root().new_tab(gfile)
 
     def __cut_uris_changed(self, *_args: Any) -> None:
-        (
-            self.add_css_class
-            if self.gfile.get_uri() in shared.cut_uris
-            else self.remove_css_class
-        )("cut-item")
+        (self.add_css_class if self.uri in shared.cut_uris else self.remove_css_class)(
+            "cut-item"
+        )
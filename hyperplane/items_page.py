@@ -20,10 +20,10 @@
 """A view of `HypItem`s to be added to an `AdwNavigationView`."""
 import logging
 from collections import namedtuple
+from functools import lru_cache
 from itertools import chain, count
 from pathlib import Path
 from shutil import get_unpack_formats, unpack_archive
-from time import time
 from typing import Any, Callable, Generator, Iterable, Optional
 
 from gi.repository import Adw, Gdk, Gio, GLib, GObject, Gtk, Pango, Xdp, XdpGtk4
@@ -37,8 +37,8 @@ from hyperplane.new_file_dialog import HypNewFileDialog
 from hyperplane.utils.create_alert_dialog import create_alert_dialog
 from hyperplane.utils.dates import relative_date
 from hyperplane.utils.files import (
+    CopyOperation,
     YouAreStupid,
-    copy,
     execute,
     get_gfile_display_name,
     get_gfile_path,
@@ -49,7 +49,7 @@ from hyperplane.utils.files import (
     validate_name,
 )
 from hyperplane.utils.iterplane import iterplane
-from hyperplane.utils.undo import undo
+from hyperplane.utils.undo import add_to_undo_queue, undo
 
 
 @Gtk.Template(resource_path=shared.PREFIX + "/gtk/items-page.ui")
@@ -331,15 +331,9 @@ class HypItemsPage(Adw.NavigationPage):
     def get_dst(self) -> Gio.File:
         """Gets the destination `GFile` for paste operations to the page."""
         if self.tags:
-            tags = tuple(tag for tag in shared.tags if tag in self.tags)
-            return Gio.File.new_for_path(
-                str(
-                    Path(
-                        shared.home_path,
-                        *tags,
-                    )
-                )
-            )
+            page_tags = frozenset(self.tags)
+            tags = (tag for tag in shared.tags if tag in page_tags)
+            return Gio.File.new_for_path(str(Path(shared.home_path, *tags)))
 
         return self.gfile
 
@@ -729,8 +723,32 @@ class HypItemsPage(Adw.NavigationPage):
         dialog.set_response_enabled("create", False)
         can_create = False
 
+        # Names are checked on every keystroke, don't stat the same one twice
+        cached_validate_name = lru_cache(maxsize=64)(validate_name)
+
+        check_source = 0
+
+        def check_name(text: str) -> bool:
+            nonlocal can_create
+            nonlocal check_source
+
+            check_source = 0
+
+            can_create, message = cached_validate_name(dst, text, directory=True)
+            dialog.set_response_enabled("create", can_create)
+            revealer.set_reveal_child(bool(message))
+            if message:
+                revealer_label.set_label(message)
+
+            return False
+
         def set_inactive(*_args: Any) -> None:
             nonlocal can_create
+            nonlocal check_source
+
+            if check_source:
+                GLib.source_remove(check_source)
+                check_source = 0
 
             if not (text := entry.get_text().strip()):
                 can_create = False
@@ -738,15 +756,17 @@ class HypItemsPage(Adw.NavigationPage):
                 revealer.set_reveal_child(False)
                 return
 
-            can_create, message = validate_name(dst, text, directory=True)
-            dialog.set_response_enabled("create", can_create)
-            revealer.set_reveal_child(bool(message))
-            if message:
-                revealer_label.set_label(message)
+            # Only check the name once typing pauses
+            check_source = GLib.timeout_add(120, check_name, text)
 
         def create_folder(*_args: Any):
             nonlocal can_create
 
+            # Don't create the folder based on a check for an older name
+            if check_source:
+                GLib.source_remove(check_source)
+                check_name(entry.get_text().strip())
+
             if not can_create:
                 return
 
@@ -772,13 +792,12 @@ class HypItemsPage(Adw.NavigationPage):
 
     def __copy(self, *_args: Any) -> None:
         shared.set_cut_uris(set())
-        clipboard = Gdk.Display.get_default().get_clipboard()
         if not (items := self.get_selected_gfiles()):
             return
 
         provider = Gdk.ContentProvider.new_for_value(Gdk.FileList.new_from_array(items))
 
-        clipboard.set_content(provider)
+        shared.clipboard.set_content(provider)
 
     def __cut(self, _obj: Any, *args: Any) -> None:
         self.__copy(*args)
@@ -787,8 +806,9 @@ class HypItemsPage(Adw.NavigationPage):
         )
 
     def __paste(self, *_args: Any) -> None:
-        clipboard = Gdk.Display.get_default().get_clipboard()
+        clipboard = shared.clipboard
         files = []
+        operation = CopyOperation()
 
         dst = self.get_dst()
 
@@ -802,12 +822,17 @@ class HypItemsPage(Adw.NavigationPage):
                 shared.set_cut_uris(set())
                 return
 
+            try:
+                dst_dir = Gio.File.new_for_path(str(get_gfile_path(dst)))
+            except FileNotFoundError as error:
+                logging.debug('Cannot paste to "%s": %s', dst.get_uri(), error)
+                shared.set_cut_uris(set())
+                return
+
             for src in file_list:
                 try:
-                    final_dst = Gio.File.new_for_path(
-                        str(get_gfile_path(dst) / get_gfile_display_name(src))
-                    )
-                except (FileNotFoundError, TypeError) as error:
+                    final_dst = dst_dir.get_child(get_gfile_display_name(src))
+                except TypeError as error:
                     logging.debug('Cannot paste file "%s": %s', src.get_uri(), error)
                     continue
 
@@ -832,23 +857,20 @@ class HypItemsPage(Adw.NavigationPage):
 
                 else:
                     try:
-                        copy(src, final_dst)
+                        operation.copy(src, final_dst)
                     except FileExistsError:
                         try:
-                            final_dst = get_paste_gfile(final_dst)
-                            copy(src, final_dst)
+                            operation.copy(src, get_paste_gfile(final_dst))
                         except (FileExistsError, FileNotFoundError) as error:
                             logging.debug(
                                 'Cannot paste file "%s": %s', src.get_uri(), error
                             )
                             continue
 
-                    files.append(final_dst)
-
             if shared.cut_uris:
-                shared.undo_queue[time()] = ("move", files)
+                add_to_undo_queue(("move", files))
             else:
-                shared.undo_queue[time()] = ("copy", files)
+                add_to_undo_queue(("copy", operation))
             shared.set_cut_uris(set())
 
         def paste_texture_cb(clipboard: Gdk.Clipboard, result: Gio.AsyncResult) -> None:
@@ -46,6 +46,7 @@ class HypApplication(Adw.Application):
     """The main application singleton class."""
 
     guide: Optional[HypGuide] = None
+    about_dialog: Optional[Adw.AboutDialog] = None
 
     def __init__(self) -> None:
         super().__init__(
@@ -69,10 +70,13 @@ class HypApplication(Adw.Application):
         self.add_main_option_entries((new_window,))
         self.set_option_context_parameter_string("[DIRECTORIES]")
 
-        self.create_action("quit", lambda *_: self.quit(), ("<primary>q",))
-        self.create_action("show-guide", self.__guide, ("F1",))
-        self.create_action("about", self.__about)
-        self.create_action("preferences", self.__preferences, ("<primary>comma",))
+        for name, callback, shortcuts in (
+            ("quit", lambda *_: self.quit(), ("<primary>q",)),
+            ("show-guide", self.__guide, ("F1",)),
+            ("about", self.__about, None),
+            ("preferences", self.__preferences, ("<primary>comma",)),
+        ):
+            self.create_action(name, callback, shortcuts)
 
         # Show hidden
         show_hidden_action = Gio.SimpleAction.new_stateful(
@@ -176,6 +180,13 @@ class HypApplication(Adw.Application):
 
         return win
 
+    def do_shutdown(self) -> None:
+        """Called when the application is shutting down."""
+        # Don't keep generating thumbnails that will never be shown
+        shared.thumbnail_pool.shutdown(wait=False, cancel_futures=True)
+
+        Adw.Application.do_shutdown(self)
+
     def do_handle_local_options(self, options: GLib.VariantDict) -> int:
         """Handles local command line arguments."""
         self.register()  # This is so get_is_remote works
@@ -213,6 +224,11 @@ class HypApplication(Adw.Application):
         self.guide.present(self.get_active_window())
 
     def __about(self, *_args: Any) -> None:
+        # Parsing the metainfo is slow, so keep the dialog around after it's closed
+        if self.about_dialog:
+            self.about_dialog.present(self.get_active_window())
+            return
+
         about = Adw.AboutDialog.new_from_appdata(
             shared.PREFIX + "/" + shared.APP_ID + ".metainfo.xml", shared.VERSION
         )
@@ -228,6 +244,8 @@ class HypApplication(Adw.Application):
         about.set_translator_credits = (_("translator_credits"),)
         about.present(self.get_active_window())
 
+        self.about_dialog = about
+
     def __preferences(self, *_args: Any) -> None:
         if HypPreferencesDialog.is_open:
             return
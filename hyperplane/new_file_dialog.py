@@ -19,6 +19,7 @@
 
 """A dialog for creating a new file based on a template."""
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -55,6 +56,8 @@ class HypNewFileDialog(Adw.Dialog):
         self.dst = dst
         self.can_create = True
 
+        self._validate_name = lru_cache(maxsize=64)(validate_name)
+
         self.templates_dir = GLib.get_user_special_dir(
             GLib.UserDirectory.DIRECTORY_TEMPLATES
         )
@@ -236,7 +239,7 @@ class HypNewFileDialog(Adw.Dialog):
             self.warning_revealer.set_reveal_child(False)
             return
 
-        self.can_create, message = validate_name(self.dst, text)
+        self.can_create, message = self._validate_name(self.dst, text)
         self.create_button.set_sensitive(self.can_create)
         self.warning_revealer.set_reveal_child(bool(message))
         if message:
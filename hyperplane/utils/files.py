@@ -39,7 +39,72 @@ class YouAreStupid(Exception):
     """Raised when you try to move a folder into itself."""
 
 
-def copy(src: Gio.File, dst: Gio.File, callback: Optional[Callable] = None) -> None:
+class CopyOperation:
+    """
+    Copies files as part of a single paste or drop so that it can be undone.
+
+    Undoing stops copies that are still running
+    and removes each copy once nothing is writing to it anymore.
+    """
+
+    def __init__(self) -> None:
+        self.cancellable = Gio.Cancellable.new()
+        self.__gfiles = []
+        self.__running = set()
+        self.__undone = False
+
+    def copy(self, src: Gio.File, dst: Gio.File) -> None:
+        """
+        Asynchronously copies `src` to `dst` as part of the operation.
+
+        Raises the same exceptions as `copy()`.
+        """
+        uri = dst.get_uri()
+        self.__running.add(uri)
+
+        try:
+            copy(
+                src,
+                dst,
+                cancellable=self.cancellable,
+                finished_callback=lambda: self.__finished(dst),
+            )
+        except Exception:
+            self.__running.discard(uri)
+            raise
+
+        self.__gfiles.append(dst)
+
+    def undo(self) -> None:
+        """Stops running copies and removes all copies made by the operation."""
+        self.__undone = True
+        self.cancellable.cancel()
+
+        for gfile in self.__gfiles:
+            # Copies that are still running are removed once they stop
+            if gfile.get_uri() not in self.__running:
+                self.__remove(gfile)
+
+    def __finished(self, gfile: Gio.File) -> None:
+        self.__running.discard(gfile.get_uri())
+
+        if self.__undone:
+            self.__remove(gfile)
+
+    def __remove(self, gfile: Gio.File) -> None:
+        try:
+            rm(gfile)
+        except FileNotFoundError:
+            logging.debug("Cannot undo copy: File doesn't exist anymore.")
+
+
+def copy(
+    src: Gio.File,
+    dst: Gio.File,
+    callback: Optional[Callable] = None,
+    cancellable: Optional[Gio.Cancellable] = None,
+    finished_callback: Optional[Callable] = None,
+) -> None:
     """
     Asynchronously copies a file or directory from `src` to `dst`.
 
@@ -49,6 +114,11 @@ def copy(src: Gio.File, dst: Gio.File, callback: Optional[Callable] = None) -> N
     FileExistsError will be raised.
 
     Calls `callback` if the operation was successful.
+
+    Cancelling `cancellable` stops the copy, possibly leaving a partial copy at `dst`.
+
+    Calls `finished_callback` once the copy has stopped for any reason,
+    be it success, failure or cancellation.
     """
 
     if dst.query_exists():
@@ -66,9 +136,15 @@ def copy(src: Gio.File, dst: Gio.File, callback: Optional[Callable] = None) -> N
             try:
                 gfile.copy_finish(result)
             except GLib.Error as error:
-                logging.error(
-                    'File "%s" was unsuccessfully copied: %s', gfile.get_uri(), error
-                )
+                if not error.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                    logging.error(
+                        'File "%s" was unsuccessfully copied: %s',
+                        gfile.get_uri(),
+                        error,
+                    )
+
+                if finished_callback:
+                    finished_callback()
                 return
 
             if tag_location_created:
@@ -77,11 +153,14 @@ def copy(src: Gio.File, dst: Gio.File, callback: Optional[Callable] = None) -> N
             if callback:
                 callback()
 
+            if finished_callback:
+                finished_callback()
+
         src.copy_async(
             dst,
             Gio.FileCopyFlags.NOFOLLOW_SYMLINKS,
             GLib.PRIORITY_DEFAULT,
-            None,
+            cancellable,
             None,
             g_copy_cb,
         )
@@ -91,6 +170,8 @@ def copy(src: Gio.File, dst: Gio.File, callback: Optional[Callable] = None) -> N
         src_path = Path(get_gfile_path(src))
     except FileNotFoundError:
         logging.error('Cannot copy file "%s": Source has not path.', src.get_uri())
+        if finished_callback:
+            finished_callback()
         return
 
     try:
@@ -99,19 +180,25 @@ def copy(src: Gio.File, dst: Gio.File, callback: Optional[Callable] = None) -> N
         logging.error(
             'Cannot copy file to "%s": Destination has not path.', dst.get_uri()
         )
+        if finished_callback:
+            finished_callback()
         return
 
     def path_copy_cb(_task: Gio.Task, _res: Gio.Task) -> None:
         # TODO: Figure out error handling here?
 
-        if tag_location_created:
-            __emit_tags_changed(dst)
+        if not (cancellable and cancellable.is_cancelled()):
+            if tag_location_created:
+                __emit_tags_changed(dst)
 
-        if callback:
-            callback()
+            if callback:
+                callback()
+
+        if finished_callback:
+            finished_callback()
 
     Gio.Task.new(callback=path_copy_cb).run_in_thread(
-        lambda *_: __copy_path(src_path, dst_path)
+        lambda *_: __copy_path(src_path, dst_path, cancellable)
     )
 
 
@@ -479,15 +566,35 @@ def trash(*gfiles: Gio.File) -> None:
         gfile.trash_async(GLib.PRIORITY_DEFAULT)
 
 
-def __copy_path(src: PathLike | str, dst: PathLike | str) -> None:
+def __copy_path(
+    src: PathLike | str,
+    dst: PathLike | str,
+    cancellable: Optional[Gio.Cancellable] = None,
+) -> None:
     src = Path(src)
     dst = Path(dst)
 
     if not (parent := dst.parent).is_dir():
         parent.mkdir(parents=True)
 
+    def ignore(_directory: str, names: list[str]) -> list[str]:
+        # Stop descending once cancelled
+        if cancellable and cancellable.is_cancelled():
+            return names
+
+        return []
+
+    def copy_function(src: str, dst: str) -> str:
+        # Skip the remaining files once cancelled
+        if cancellable and cancellable.is_cancelled():
+            return dst
+
+        return shutil.copy2(src, dst)
+
     try:
-        shutil.copytree(src, dst, symlinks=True)
+        shutil.copytree(
+            src, dst, symlinks=True, ignore=ignore, copy_function=copy_function
+        )
     except FileExistsError:
         logging.error('"Copying "%s" to "%s" failed: Destination exists.', src, dst)
         return
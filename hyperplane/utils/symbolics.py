@@ -18,6 +18,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 """Miscellaneous utilities for symbolic icons."""
+from functools import lru_cache
 from typing import Optional
 
 from gi.repository import Gdk, Gio, Gtk
@@ -31,6 +32,24 @@ def get_symbolic(themed_icon: Optional[Gio.ThemedIcon]) -> Gio.ThemedIcon:
     if not themed_icon:
         return fallback_icon
 
+    return __get_symbolic_for_names(tuple(themed_icon.get_names()))
+
+
+def get_color_for_symbolic(
+    content_type: str, gicon: Optional[Gio.ThemedIcon] = None
+) -> str:
+    """Returns the color associated with a MIME type."""
+    return __get_color_for_names(
+        content_type, tuple(gicon.get_names()) if gicon else ()
+    )
+
+
+# Results only depend on the icon names and content type,
+# so they can be shared between all files of the same type
+@lru_cache(maxsize=512)
+def __get_symbolic_for_names(names: tuple[str, ...]) -> Gio.ThemedIcon:
+    themed_icon = Gio.ThemedIcon.new_from_names(names)
+
     icon_paintable = icon_theme.lookup_by_gicon(
         themed_icon, 1, 1, Gtk.TextDirection.NONE, Gtk.IconLookupFlags.FORCE_SYMBOLIC
     )
@@ -47,18 +66,15 @@ def get_symbolic(themed_icon: Optional[Gio.ThemedIcon]) -> Gio.ThemedIcon:
 
 
 # pylint: disable=too-many-return-statements
-def get_color_for_symbolic(
-    content_type: str, gicon: Optional[Gio.ThemedIcon] = None
-) -> str:
-    """Returns the color associated with a MIME type."""
-
+@lru_cache(maxsize=512)
+def __get_color_for_names(content_type: str, names: tuple[str, ...]) -> str:
     if not content_type:
         return "gray"
 
     if content_type == "inode/directory":
         return "blue"
 
-    names = gicon.get_names()
+    names = list(names)
 
     # Remove the fallback name when choosing color
     if len(names) > 1 and names[0] == "text-x-generic-symbolic":
@@ -84,7 +100,7 @@ def get_color_for_symbolic(
         "x-office-spreadsheet-template": "green",
     }
 
-    if gicon and (color := detailed.get(names[0].replace("-symbolic", ""))):
+    if names and (color := detailed.get(names[0].replace("-symbolic", ""))):
         return color
 
     generic = {
@@ -104,7 +120,7 @@ def get_color_for_symbolic(
         "x-office-drawing": "orange",
     }
 
-    if gicon and (color := generic.get(names[-1].replace("-symbolic", ""))):
+    if names and (color := generic.get(names[-1].replace("-symbolic", ""))):
         return color
 
     mimes = {
@@ -121,3 +137,7 @@ def get_color_for_symbolic(
 
     # Fallback
     return "gray"
+
+
+# The symbolic icons that are available depend on the icon theme
+icon_theme.connect("changed", lambda *_: __get_symbolic_for_names.cache_clear())
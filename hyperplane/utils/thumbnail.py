@@ -19,12 +19,120 @@
 
 """Utilities for working with thumbnails."""
 import logging
-from typing import Any, Callable
+from concurrent.futures import Future
+from functools import cache
+from os import stat
+from threading import Lock
+from typing import Any, Callable, Optional
 
 from gi.repository import Gdk, GdkPixbuf, Gio, GLib, GnomeDesktop
 
+from hyperplane import shared
 from hyperplane.utils.files import get_gfile_path
 
+_texture_cache_lock = Lock()
+
+
+def queue_thumbnail(
+    func: Callable, func_args: tuple, callback: Callable, *args: Any
+) -> Future:
+    """
+    Calls `func(*func_args, callback, *args)` on the thumbnail pool
+    and returns the `Future` representing the job.
+
+    `func` should be either `load_thumbnail` or `generate_thumbnail`.
+
+    If `func` raises, the error is logged and `callback` is called with None and *args
+    unless it has been called already.
+    """
+
+    def run() -> None:
+        called = False
+
+        def job_callback(*callback_args: Any) -> None:
+            nonlocal called
+
+            called = True
+            callback(*callback_args)
+
+        try:
+            func(*func_args, job_callback, *args)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logging.exception("Thumbnail job failed")
+            if not called:
+                callback(None, *args)
+
+    return shared.thumbnail_pool.submit(run)
+
+
+def get_cached_thumbnail(path: str) -> Optional[Gdk.Texture]:
+    """
+    Returns the thumbnail at `path` as a `Gdk.Texture`
+    if it has been loaded recently and hasn't changed since, otherwise None.
+    """
+    try:
+        key = (path, stat(path).st_mtime_ns)
+    except OSError:
+        return None
+
+    return __get_cached_texture(key)
+
+
+def load_thumbnail(path: str, callback: Callable, *args: Any) -> None:
+    """
+    Loads the thumbnail at `path` and passes it to `callback` as a `Gdk.Texture` with any additional args.
+
+    If loading the thumbnail fails, `callback` is called with None and *args.
+
+    Recently loaded thumbnails are reused as long as the file hasn't changed
+    and a thumbnail that is already being loaded is not loaded again.
+    """
+    try:
+        key = (path, stat(path).st_mtime_ns)
+    except OSError as error:
+        logging.debug("Cannot load thumbnail: %s", error)
+        callback(None, *args)
+        return
+
+    with _texture_cache_lock:
+        if texture := shared.texture_cache.get(key):
+            shared.texture_cache.move_to_end(key)
+        elif key in shared.thumbnail_requests:
+            # Let the thread already loading it call back once it is done
+            shared.thumbnail_requests[key].append((callback, args))
+            return
+        else:
+            shared.thumbnail_requests[key] = [(callback, args)]
+
+    if texture:
+        callback(texture, *args)
+        return
+
+    try:
+        texture = Gdk.Texture.new_from_filename(path)
+    except GLib.Error as error:
+        logging.debug("Cannot load thumbnail: %s", error)
+        texture = None
+
+    with _texture_cache_lock:
+        requests = shared.thumbnail_requests.pop(key)
+
+        if texture:
+            shared.texture_cache[key] = texture
+            if len(shared.texture_cache) > shared.TEXTURE_CACHE_SIZE:
+                shared.texture_cache.popitem(last=False)
+
+    for request_callback, request_args in requests:
+        request_callback(texture, *request_args)
+
+
+def can_thumbnail(content_type: Optional[str]) -> bool:
+    """Whether a thumbnailer is installed for files of `content_type`."""
+    if not content_type:
+        return False
+
+    return __can_thumbnail_type(content_type)
+
 
 def generate_thumbnail(
     gfile: Gio.File, content_type: str, callback: Callable, *args: Any
@@ -34,9 +142,7 @@ def generate_thumbnail(
 
     If the thumbnail generation fails, `callback` is called with None and *args.
     """
-    factory = GnomeDesktop.DesktopThumbnailFactory.new(
-        GnomeDesktop.DesktopThumbnailSize.LARGE
-    )
+    factory = __get_factory()
     uri = gfile.get_uri()
 
     try:
@@ -99,3 +205,24 @@ def generate_thumbnail(
 
     factory.save_thumbnail(thumbnail, uri, mtime)
     callback(Gdk.Texture.new_for_pixbuf(thumbnail), *args)
+
+
+def __get_cached_texture(key: tuple[str, int]) -> Optional[Gdk.Texture]:
+    with _texture_cache_lock:
+        if texture := shared.texture_cache.get(key):
+            shared.texture_cache.move_to_end(key)
+
+    return texture
+
+
+@cache
+def __get_factory() -> GnomeDesktop.DesktopThumbnailFactory:
+    return GnomeDesktop.DesktopThumbnailFactory.new(
+        GnomeDesktop.DesktopThumbnailSize.LARGE
+    )
+
+
+@cache
+def __can_thumbnail_type(content_type: str) -> bool:
+    # No failed thumbnail can exist for the root, so this only checks the MIME type
+    return __get_factory().can_thumbnail("file:///", content_type, 0)
@@ -19,12 +19,30 @@
 
 """Utilities for interacting with the undo queue."""
 import logging
-from typing import Any
+from itertools import count
+from typing import Any, Optional
 
 from gi.repository import Adw, GLib
 
 from hyperplane import shared
-from hyperplane.utils.files import YouAreStupid, move, restore, rm
+from hyperplane.utils.files import YouAreStupid, move, restore
+
+_keys = count()
+
+
+def add_to_undo_queue(item: tuple, toast: Optional[Adw.Toast] = None) -> None:
+    """
+    Adds `item` to the undo queue, keyed by `toast` if the action has one.
+
+    Only the last `shared.UNDO_QUEUE_SIZE` actions are kept.
+    """
+    shared.undo_queue[toast or next(_keys)] = item
+
+    while len(shared.undo_queue) > shared.UNDO_QUEUE_SIZE:
+        key = next(iter(shared.undo_queue))
+        if isinstance(key, Adw.Toast):
+            key.dismiss()
+        del shared.undo_queue[key]
 
 
 def undo(obj: Any, *_args: Any) -> None:
@@ -36,38 +54,47 @@ def undo(obj: Any, *_args: Any) -> None:
     if isinstance(obj, Adw.Toast):
         index = obj
     else:
-        index = tuple(shared.undo_queue.keys())[-1]
-
-    item = shared.undo_queue[index]
-
-    match item[0]:
-        case "copy":
-            for copy_item in item[1]:
-                try:
-                    rm(copy_item)
-                except FileNotFoundError:
-                    logging.debug("Cannot undo copy: File doesn't exist anymore.")
-
-        case "move":
-            for gfiles in item[1]:
-                try:
-                    move(gfiles[1], gfiles[0])
-                except FileExistsError:
-                    logging.debug("Cannot undo move: File exists.")
-                except YouAreStupid:
-                    logging.debug("Cannot undo move: Someone is being stupid.")
-
-        case "rename":
-            try:
-                item[1].set_display_name(item[2])
-            except GLib.Error as error:
-                logging.debug("Cannot undo rename: %s", error)
-
-        case "trash":
-            for trash_item in item[1]:
-                restore(*trash_item)
+        index = next(reversed(shared.undo_queue))
+
+    if not (item := shared.undo_queue.pop(index, None)):
+        return
+
+    if handler := _HANDLERS.get(item[0]):
+        handler(item)
 
     if isinstance(index, Adw.Toast):
         index.dismiss()
 
-    shared.undo_queue.popitem()
+
+def __undo_copy(item: tuple) -> None:
+    item[1].undo()
+
+
+def __undo_move(item: tuple) -> None:
+    for gfiles in item[1]:
+        try:
+            move(gfiles[1], gfiles[0])
+        except FileExistsError:
+            logging.debug("Cannot undo move: File exists.")
+        except YouAreStupid:
+            logging.debug("Cannot undo move: Someone is being stupid.")
+
+
+def __undo_rename(item: tuple) -> None:
+    try:
+        item[1].set_display_name(item[2])
+    except GLib.Error as error:
+        logging.debug("Cannot undo rename: %s", error)
+
+
+def __undo_trash(item: tuple) -> None:
+    for trash_item in item[1]:
+        restore(*trash_item)
+
+
+_HANDLERS = {
+    "copy": __undo_copy,
+    "move": __undo_move,
+    "rename": __undo_rename,
+    "trash": __undo_trash,
+}
@@ -19,6 +19,7 @@
 
 """The main application window."""
 import logging
+from functools import lru_cache
 from itertools import chain
 from time import time
 from typing import Any, Callable, Iterable, Optional, Self
@@ -36,8 +37,8 @@ from hyperplane.properties import HypPropertiesDialog
 from hyperplane.tag_row import HypTagRow
 from hyperplane.utils.create_alert_dialog import create_alert_dialog
 from hyperplane.utils.files import (
+    CopyOperation,
     clear_recent_files,
-    copy,
     empty_trash,
     get_gfile_display_name,
     get_gfile_path,
@@ -47,7 +48,7 @@ from hyperplane.utils.files import (
     validate_name,
 )
 from hyperplane.utils.tags import add_tags, move_tag, remove_tags
-from hyperplane.utils.undo import undo
+from hyperplane.utils.undo import add_to_undo_queue, undo
 from hyperplane.volumes_box import HypVolumesBox
 
 
@@ -240,6 +241,8 @@ class HypWindow(Adw.ApplicationWindow):
 
         self.can_rename = True
         self.rename_item = None
+        self._validate_rename = validate_name
+        self._rename_check_source = 0
         self.rename_entry.connect("changed", self.__rename_state_changed)
         self.rename_popover.connect("closed", self.__rename_popover_closed)
         self.rename_entry.connect("entry-activated", self.__do_rename)
@@ -536,9 +539,10 @@ class HypWindow(Adw.ApplicationWindow):
 
     def __navigation_changed(self, view: Adw.NavigationView, *_args: Any) -> None:
         self.__hide_search_entry()
-        view.get_visible_page().item_filter.changed(Gtk.FilterChange.LESS_STRICT)
+        visible_page = view.get_visible_page()
+        visible_page.item_filter.changed(Gtk.FilterChange.LESS_STRICT)
 
-        title = view.get_visible_page().get_title()
+        title = visible_page.get_title()
 
         if page := self.tab_view.get_page(view.get_parent()):
             page.set_title(title)
@@ -833,6 +837,8 @@ class HypWindow(Adw.ApplicationWindow):
         else:
             self.rename_label.set_label(_("Rename File"))
 
+        # Fresh for each rename so results don't outlive the popover
+        self._validate_rename = lru_cache(maxsize=64)(validate_name)
         self.rename_entry.set_text(item.edit_name)
 
         self.rename_popover.popup()
@@ -843,6 +849,14 @@ class HypWindow(Adw.ApplicationWindow):
         if not self.rename_item:
             return
 
+        # Don't rename based on a check for an older name
+        if self._rename_check_source:
+            GLib.source_remove(self._rename_check_source)
+            self.__check_rename(self.rename_entry.get_text().strip())
+
+            if not self.can_rename:
+                return
+
         self.rename_popover.popdown()
         try:
             new_file = self.rename_item.gfile.set_display_name(
@@ -853,12 +867,16 @@ class HypWindow(Adw.ApplicationWindow):
                 'Cannot rename file "%s": %s', self.rename_item.gfile.get_uri(), error
             )
         else:
-            shared.undo_queue[time()] = ("rename", new_file, self.rename_item.edit_name)
+            add_to_undo_queue(("rename", new_file, self.rename_item.edit_name))
 
     def __rename_popover_closed(self, *_args: Any) -> None:
         self.rename_popover.unparent()
 
     def __rename_state_changed(self, *_args: Any) -> None:
+        if self._rename_check_source:
+            GLib.source_remove(self._rename_check_source)
+            self._rename_check_source = 0
+
         if (not self.rename_popover.is_visible()) or (not self.rename_item):
             return
 
@@ -870,12 +888,25 @@ class HypWindow(Adw.ApplicationWindow):
             self.rename_revealer.set_reveal_child(False)
             return
 
-        self.can_rename, message = validate_name(self.rename_item.gfile, text, True)
+        # Validating touches the disk, wait until the user stops typing
+        self._rename_check_source = GLib.timeout_add(120, self.__check_rename, text)
+
+    def __check_rename(self, text: str) -> bool:
+        self._rename_check_source = 0
+
+        if (not self.rename_popover.is_visible()) or (not self.rename_item):
+            return False
+
+        self.can_rename, message = self._validate_rename(
+            self.rename_item.gfile, text, True
+        )
         self.rename_button.set_sensitive(self.can_rename)
         self.rename_revealer.set_reveal_child(bool(message))
         if message:
             self.rename_revealer_label.set_label(message)
 
+        return False
+
     def __view_changed(self, *_args: Any) -> None:
         for button in (self.header_bar_view_button, self.action_bar_view_button):
             button.set_icon_name(
@@ -981,7 +1012,7 @@ class HypWindow(Adw.ApplicationWindow):
             )
 
         toast = self.send_toast(message, do_undo=True)
-        shared.undo_queue[toast] = ("trash", files)
+        add_to_undo_queue(("trash", files), toast)
         toast.connect("button-clicked", undo)
 
         self.trash_animation.play()
@@ -1016,11 +1047,12 @@ class HypWindow(Adw.ApplicationWindow):
                 return False
 
         if isinstance(value, Gdk.FileList):
-            dst = self.get_visible_page().get_dst()
+            dst = page.get_dst()
+            dst_uri = dst.get_uri()
             for src in value:
                 uri = src.get_uri()
 
-                if uri == dst.get_uri():
+                if uri == dst_uri:
                     self.send_toast(_("You cannot move a folder into itself"))
                     return False
 
@@ -1037,6 +1069,7 @@ class HypWindow(Adw.ApplicationWindow):
                 drag.get_selected_action()
                 if (drag := drop_target.get_current_drop().get_drag())
                 else Gdk.DragAction.COPY,
+                dst,
             )
 
         if isinstance(value, Gdk.Texture):
@@ -1049,11 +1082,13 @@ class HypWindow(Adw.ApplicationWindow):
 
         return False
 
-    def __drop_file_list(self, file_list: Gdk.FileList, action: Gdk.DragAction) -> bool:
-        dst = self.get_visible_page().get_dst()
+    def __drop_file_list(
+        self, file_list: Gdk.FileList, action: Gdk.DragAction, dst: Gio.File
+    ) -> bool:
         should_move = action == Gdk.DragAction.MOVE
 
         files = []
+        operation = CopyOperation()
 
         for src in file_list:
             try:
@@ -1079,19 +1114,19 @@ class HypWindow(Adw.ApplicationWindow):
                         == Gio.FileType.DIRECTORY
                         else _("A file with that name already exists")
                     )
+                else:
+                    files.append((src, child))
             else:
                 try:
-                    copy(src, child)
+                    operation.copy(src, child)
                 except FileExistsError:
                     try:
-                        copy(src, get_paste_gfile(child))
+                        operation.copy(src, get_paste_gfile(child))
                     except (FileExistsError, FileNotFoundError) as error:
                         logging.warning("Cannot drop files: %s", error)
                         return False
 
-            files.append((src, child) if should_move else child)
-
-        shared.undo_queue[time()] = ("move" if should_move else "copy", files)
+        add_to_undo_queue(("move", files) if should_move else ("copy", operation))
         return True
 
     def __drop_texture(self, texture: Gdk.Texture) -> None: